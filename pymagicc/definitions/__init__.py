@@ -11,8 +11,14 @@ For more details about how these constants are used, see the documentation of
 ``pymagicc.io``. In particular, the documentation of
 ``pymagicc.io.get_special_scen_code``, ``pymagicc.io.get_dattype_regionmode`` and
 ``pymagicc.io.get_region_order`` in :ref:`pymagicc.io`.
+
+The variable and region mappings (e.g. ``MAGICC7_TO_OPENSCM_VARIABLES_MAPPING``) are
+shared, read-only views (:obj:`types.MappingProxyType`), use e.g.
+``get_magicc7_to_openscm_variable_mapping`` if you need a ``dict`` to modify.
 """
 from pathlib import Path
+from types import MappingProxyType
+import sys
 import warnings
 import functools
 
@@ -35,40 +41,48 @@ path = Path(__file__).parent
 
 _dtrm = read_datapackage(path, "magicc_dattype_regionmode_regions")
 
-_region_cols = _dtrm.columns.to_series().apply(lambda x: x.startswith("region"))
+_region_cols = _dtrm.columns.str.startswith("region")
+
+_regions = _dtrm.loc[:, _region_cols].to_numpy(dtype=object)
+_regions_notnull = pd.notna(_regions)
 
-DATTYPE_REGIONMODE_REGIONS = _dtrm.loc[:, ~_region_cols].copy()
+DATTYPE_REGIONMODE_REGIONS = _dtrm.loc[:, ~_region_cols].assign(
+    regions=[list(raw[notnull]) for raw, notnull in zip(_regions, _regions_notnull)]
+)
 """:obj:`pandas.DataFrame` Mapping between regions and whether a file is SCEN7 or not and the expected values of THISFILE_DATTYPE and THISFILE_REGIONMODE flags in MAGICC.
 """
 
-DATTYPE_REGIONMODE_REGIONS["regions"] = [
-    [r for r in raw if not pd.isnull(r)]
-    for raw in _dtrm.loc[:, _region_cols].values.tolist()
-]
-
 MAGICC7_EMISSIONS_UNITS = read_datapackage(path, "magicc_emisssions_units")
 """:obj:`pandas.DataFrame` Definitions of emissions variables and their expected units in MAGICC7.
 """
 
-PART_OF_SCENFILE_WITH_EMISSIONS_CODE_0 = MAGICC7_EMISSIONS_UNITS[
-    MAGICC7_EMISSIONS_UNITS["part_of_scenfile_with_emissions_code_0"]
-]["magicc_variable"].tolist()
+
+def _get_flagged_magicc7_emissions(flag_column):
+    # index the underlying arrays directly to avoid boolean indexing (and hence
+    # copying) the whole DataFrame
+    magicc_variables = MAGICC7_EMISSIONS_UNITS["magicc_variable"].to_numpy()
+    flags = MAGICC7_EMISSIONS_UNITS[flag_column].to_numpy(dtype=bool)
+
+    return magicc_variables[flags].tolist()
+
+
+PART_OF_SCENFILE_WITH_EMISSIONS_CODE_0 = _get_flagged_magicc7_emissions(
+    "part_of_scenfile_with_emissions_code_0"
+)
 """list: The emissions which are included in a SCEN file if the SCEN emms code is 0.
 
 See documentation of ``pymagicc.io.get_special_scen_code`` for more details.
 """
 
-PART_OF_SCENFILE_WITH_EMISSIONS_CODE_1 = MAGICC7_EMISSIONS_UNITS[
-    MAGICC7_EMISSIONS_UNITS["part_of_scenfile_with_emissions_code_1"]
-]["magicc_variable"].tolist()
+PART_OF_SCENFILE_WITH_EMISSIONS_CODE_1 = _get_flagged_magicc7_emissions(
+    "part_of_scenfile_with_emissions_code_1"
+)
 """list: The emissions which are included in a SCEN file if the SCEN emms code is 1.
 
 See documentation of ``pymagicc.io.get_special_scen_code`` for more details.
 """
 
-PART_OF_PRNFILE = MAGICC7_EMISSIONS_UNITS[MAGICC7_EMISSIONS_UNITS["part_of_prnfile"]][
-    "magicc_variable"
-].tolist()
+PART_OF_PRNFILE = _get_flagged_magicc7_emissions("part_of_prnfile")
 """list: The emissions which are included in a ``.prn`` file.
 """
 
@@ -77,6 +91,14 @@ MAGICC7_CONCENTRATIONS_UNITS = read_datapackage(path, "magicc_concentrations_uni
 """
 
 
+def _freeze_mapping(mapping):
+    # The mapped strings end up repeated throughout the DataFrames we read, so we
+    # intern them to share a single copy of each one (and make comparisons between
+    # them cheap). We then return a read-only view so the cached mappings can be
+    # shared safely.
+    return MappingProxyType({sys.intern(k): sys.intern(v) for k, v in mapping.items()})
+
+
 def get_magicc_region_to_openscm_region_mapping(inverse=False):
     """Get the mappings from MAGICC to OpenSCM regions.
 
@@ -94,21 +116,33 @@ def get_magicc_region_to_openscm_region_mapping(inverse=False):
     dict
         Dictionary of mappings
     """
+    return dict(_get_magicc_region_to_openscm_region_mapping(inverse))
+
+
+def _get_magicc_region_to_openscm_region_mapping(inverse):
+    mapping, inverse_mapping = _build_magicc_region_to_openscm_region_mappings()
+
+    return inverse_mapping if inverse else mapping
+
+
+@functools.lru_cache(None)
+def _build_magicc_region_to_openscm_region_mappings():
     world = "World"
+    named_world_regions = {
+        "BUNKERS": "Bunkers",
+        "OCEAN": "Ocean",
+        "LAND": "Land",
+        "N34": "El Nino N3.4",
+        "AMV": "North Atlantic Ocean",
+    }
 
     def get_openscm_replacement(in_region):
         if in_region in ("WORLD", "GLOBAL"):
             return world
-        if in_region in ("BUNKERS",):
-            return DATA_HIERARCHY_SEPARATOR.join([world, "Bunkers"])
-        if in_region in ("OCEAN",):
-            return DATA_HIERARCHY_SEPARATOR.join([world, "Ocean"])
-        if in_region in ("LAND",):
-            return DATA_HIERARCHY_SEPARATOR.join([world, "Land"])
-        if in_region in ("N34",):
-            return DATA_HIERARCHY_SEPARATOR.join([world, "El Nino N3.4"])
-        if in_region in ("AMV",):
-            return DATA_HIERARCHY_SEPARATOR.join([world, "North Atlantic Ocean"])
+        if in_region in named_world_regions:
+            return DATA_HIERARCHY_SEPARATOR.join(
+                [world, named_world_regions[in_region]]
+            )
         elif in_region.startswith(("NH", "SH")):
             in_region = in_region.replace("-", "")
             hem = "Northern Hemisphere" if "NH" in in_region else "Southern Hemisphere"
@@ -157,37 +191,38 @@ def get_magicc_region_to_openscm_region_mapping(inverse=False):
     ]
 
     replacements = {}
+    inverse_replacements = {}
     for magicc_region in _magicc_regions:
         openscm_region = get_openscm_replacement(magicc_region)
-        # i.e. if we've already got a value for the inverse, we don't want to overwrite
-        if (openscm_region in replacements.values()) and inverse:
-            continue
         replacements[magicc_region] = openscm_region
+        # i.e. if we've already got a value for the inverse, we don't want to overwrite
+        if openscm_region not in inverse_replacements:
+            inverse_replacements[openscm_region] = magicc_region
+
+    # R6 doesn't really exist, they're supposed to be the SSP database's R5.2
+    # regions. The R6 regions appeared in a few SSP scenario files (but will
+    # hopefully never be released) to this is just in case.
+    for r6 in ["R6OECD90", "R6REF", "R6LAM", "R6MAF", "R6ASIA"]:
+        replacements[r6] = "{}|{}".format(
+            world, r6.replace("R6", "R5.2").replace("90", "")
+        )
 
-    if inverse:
-        return {v: k for k, v in replacements.items()}
-    else:
-        # R6 doesn't really exist, they're supposed to be the SSP database's R5.2
-        # regions. The R6 regions appeared in a few SSP scenario files (but will
-        # hopefully never be released) to this is just in case.
-        for r6 in ["R6OECD90", "R6REF", "R6LAM", "R6MAF", "R6ASIA"]:
-            replacements[r6] = "{}|{}".format(
-                world, r6.replace("R6", "R5.2").replace("90", "")
-            )
-        return replacements
+    return _freeze_mapping(replacements), _freeze_mapping(inverse_replacements)
 
 
-MAGICC_REGION_TO_OPENSCM_REGION_MAPPING = get_magicc_region_to_openscm_region_mapping()
-"""dict: Mappings from MAGICC regions to OpenSCM regions"""
+MAGICC_REGION_TO_OPENSCM_REGION_MAPPING = _get_magicc_region_to_openscm_region_mapping(
+    False
+)
+"""types.MappingProxyType: Read-only mappings from MAGICC regions to OpenSCM regions"""
 
-OPENSCM_REGION_TO_MAGICC_REGION_MAPPING = get_magicc_region_to_openscm_region_mapping(
-    inverse=True
+OPENSCM_REGION_TO_MAGICC_REGION_MAPPING = _get_magicc_region_to_openscm_region_mapping(
+    True
 )
-"""dict: Mappings from OpenSCM regions to MAGICC regions
+"""types.MappingProxyType: Read-only mappings from OpenSCM regions to MAGICC regions
 """
 
 
-@functools.lru_cache(None)
+@functools.lru_cache(maxsize=4096)
 def _apply_convert_magicc_to_openscm_regions(regions, inverse):
     if inverse:
         return apply_string_substitutions(
@@ -228,6 +263,46 @@ def convert_magicc_to_openscm_regions(regions, inverse=False):
         return _apply_convert_magicc_to_openscm_regions(regions, inverse)
 
 
+# prefixes of the OpenSCM variables which correspond to each MAGICC7 suffix
+_MAGICC7_SUFFIX_PREFIXES = {
+    "EMIS": "Emissions",
+    "CONC": "Atmospheric Concentrations",
+    "ERF": "Effective Radiative Forcing",
+    "RF": "Radiative Forcing",
+    "OT": "Optical Thickness",
+    "INVERSE_EMIS": "Inverse Emissions",
+}
+
+# case adjustments applied when converting MAGICC7 variable names to OpenSCM
+_MAGICC7_CASE_ADJUSTMENTS = {
+    "SOX": "SOx",
+    "NOX": "NOx",
+    "CC4F8": "cC4F8",
+    "HFC134A": "HFC134a",
+    "HFC143A": "HFC143a",
+    "HFC152A": "HFC152a",
+    "HFC227EA": "HFC227ea",
+    "HFC236FA": "HFC236fa",
+    "HFC245FA": "HFC245fa",
+    "HFC365MFC": "HFC365mfc",
+    "HCFC141B": "HCFC141b",
+    "HCFC142B": "HCFC142b",
+    "CH3CCL3": "CH3CCl3",
+    "CCL4": "CCl4",
+    "CH3CL": "CH3Cl",
+    "CH2CL2": "CH2Cl2",
+    "CHCL3": "CHCl3",
+    "CH3BR": "CH3Br",
+    "HALON1211": "Halon1211",
+    "HALON1301": "Halon1301",
+    "HALON2402": "Halon2402",
+    "HALON1202": "Halon1202",
+    "SOLAR": "Solar",
+    "VOLCANIC": "Volcanic",
+    "EXTRA": "Extra",
+}
+
+
 def get_magicc7_to_openscm_variable_mapping(inverse=False):
     """Get the mappings from MAGICC7 to OpenSCM variables.
 
@@ -241,24 +316,19 @@ def get_magicc7_to_openscm_variable_mapping(inverse=False):
     dict
         Dictionary of mappings
     """
+    return dict(_get_magicc7_to_openscm_variable_mapping(inverse))
+
+
+def _get_magicc7_to_openscm_variable_mapping(inverse):
+    mapping, inverse_mapping = _build_magicc7_to_openscm_variable_mappings()
+
+    return inverse_mapping if inverse else mapping
 
-    def get_openscm_replacement(in_var):
-        if in_var.endswith("_INVERSE_EMIS"):
-            prefix = "Inverse Emissions"
-        elif in_var.endswith("_EMIS"):
-            prefix = "Emissions"
-        elif in_var.endswith("_CONC"):
-            prefix = "Atmospheric Concentrations"
-        elif in_var.endswith("_ERF"):
-            prefix = "Effective Radiative Forcing"
-        elif in_var.endswith("_RF"):
-            prefix = "Radiative Forcing"
-        elif in_var.endswith("_OT"):
-            prefix = "Optical Thickness"
-        else:
-            raise ValueError("This shouldn't happen")
 
-        variable = in_var.split("_")[0]
+@functools.lru_cache(None)
+def _build_magicc7_to_openscm_variable_mappings():
+    def get_openscm_variable(base_var):
+        variable = base_var
         # I hate edge cases
         if variable.endswith("EQ"):
             variable = variable.replace("EQ", " Equivalent")
@@ -297,38 +367,8 @@ def get_magicc7_to_openscm_variable_mapping(inverse=False):
         elif variable.endswith("T"):
             variable = variable[:-1]
 
-        case_adjustments = {
-            "SOX": "SOx",
-            "NOX": "NOx",
-            "CC4F8": "cC4F8",
-            "HFC134A": "HFC134a",
-            "HFC143A": "HFC143a",
-            "HFC152A": "HFC152a",
-            "HFC227EA": "HFC227ea",
-            "HFC236FA": "HFC236fa",
-            "HFC245FA": "HFC245fa",
-            "HFC365MFC": "HFC365mfc",
-            "HCFC141B": "HCFC141b",
-            "HCFC142B": "HCFC142b",
-            "CH3CCL3": "CH3CCl3",
-            "CCL4": "CCl4",
-            "CH3CL": "CH3Cl",
-            "CH2CL2": "CH2Cl2",
-            "CHCL3": "CHCl3",
-            "CH3BR": "CH3Br",
-            "HALON1211": "Halon1211",
-            "HALON1301": "Halon1301",
-            "HALON2402": "Halon2402",
-            "HALON1202": "Halon1202",
-            "SOLAR": "Solar",
-            "VOLCANIC": "Volcanic",
-            "EXTRA": "Extra",
-        }
-        variable = apply_string_substitutions(variable, case_adjustments)
-
-        return DATA_HIERARCHY_SEPARATOR.join([prefix, variable])
+        return apply_string_substitutions(variable, _MAGICC7_CASE_ADJUSTMENTS)
 
-    magicc7_suffixes = ["_EMIS", "_CONC", "_ERF", "_RF", "_OT", "_INVERSE_EMIS"]
     magicc7_base_vars = MAGICC7_EMISSIONS_UNITS.magicc_variable.tolist() + [
         "SOLAR",
         "VOLCANIC",
@@ -344,13 +384,15 @@ def get_magicc7_to_openscm_variable_mapping(inverse=False):
         "CO2CH4N2O",
         "EXTRA",
     ]
-    magicc7_vars = [
-        base_var + suffix
-        for base_var in magicc7_base_vars
-        for suffix in magicc7_suffixes
-    ]
 
-    replacements = {m7v: get_openscm_replacement(m7v) for m7v in magicc7_vars}
+    replacements = {}
+    for base_var in magicc7_base_vars:
+        # the OpenSCM variable doesn't depend on the suffix so only derive it once
+        variable = get_openscm_variable(base_var)
+        for suffix, prefix in _MAGICC7_SUFFIX_PREFIXES.items():
+            replacements[
+                "{}_{}".format(base_var, suffix)
+            ] = DATA_HIERARCHY_SEPARATOR.join([prefix, variable])
 
     rf_updates = {
         "TOTAL_INCLVOLCANIC_RF": "Radiative Forcing",
@@ -411,32 +453,30 @@ def get_magicc7_to_openscm_variable_mapping(inverse=False):
     }
     replacements.update(ocean_temp_layer)
 
-    if inverse:
-        return {v: k for k, v in replacements.items()}
-    else:
-        # these come from MAGICC's output
-        one_way_replacements = {
-            "CO2T_EMIS": "Emissions|CO2",
-            "CH4T_EMIS": "Emissions|CH4",
-            "N2OT_EMIS": "Emissions|N2O",
-            "SURFACE_TEMP_SUBANNUAL": "Surface Temperature",
-        }
-        replacements.update(one_way_replacements)
-        return replacements
+    inverse_replacements = {v: k for k, v in replacements.items()}
 
+    # these come from MAGICC's output
+    one_way_replacements = {
+        "CO2T_EMIS": "Emissions|CO2",
+        "CH4T_EMIS": "Emissions|CH4",
+        "N2OT_EMIS": "Emissions|N2O",
+        "SURFACE_TEMP_SUBANNUAL": "Surface Temperature",
+    }
+    replacements.update(one_way_replacements)
+
+    return _freeze_mapping(replacements), _freeze_mapping(inverse_replacements)
 
-MAGICC7_TO_OPENSCM_VARIABLES_MAPPING = get_magicc7_to_openscm_variable_mapping()
-"""dict: Mappings from MAGICC7 variables to OpenSCM variables
+
+MAGICC7_TO_OPENSCM_VARIABLES_MAPPING = _get_magicc7_to_openscm_variable_mapping(False)
+"""types.MappingProxyType: Read-only mappings from MAGICC7 variables to OpenSCM variables
 """
 
-OPENSCM_TO_MAGICC7_VARIABLES_MAPPING = get_magicc7_to_openscm_variable_mapping(
-    inverse=True
-)
-"""dict: Mappings from OpenSCM variables to MAGICC7 variables
+OPENSCM_TO_MAGICC7_VARIABLES_MAPPING = _get_magicc7_to_openscm_variable_mapping(True)
+"""types.MappingProxyType: Read-only mappings from OpenSCM variables to MAGICC7 variables
 """
 
 
-@functools.lru_cache(None)
+@functools.lru_cache(maxsize=4096)
 def _apply_convert_magicc7_to_openscm_variables(v, inverse):
     if inverse:
         return apply_string_substitutions(
@@ -479,6 +519,10 @@ def convert_magicc7_to_openscm_variables(variables, inverse=False):
         return _apply_convert_magicc7_to_openscm_variables(variables, inverse)
 
 
+# removes the hyphens and spaces which MAGICC6 sometimes has in its variable names
+_MAGICC6_SEPARATORS_TRANSLATION = str.maketrans("", "", "- ")
+
+
 def get_magicc6_to_magicc7_variable_mapping(inverse=False):
     """Get the mappings from MAGICC6 to MAGICC7 variables.
 
@@ -500,6 +544,11 @@ def get_magicc6_to_magicc7_variable_mapping(inverse=False):
     dict
         Dictionary of mappings
     """
+    return dict(_get_magicc6_to_magicc7_variable_mapping(inverse))
+
+
+@functools.lru_cache(None)
+def _get_magicc6_to_magicc7_variable_mapping(inverse):
     # we generate the mapping dynamically, the first name in the list
     # is the one which will be used for inverse mappings
     magicc6_simple_mapping_vars = [
@@ -595,9 +644,11 @@ def get_magicc6_to_magicc7_variable_mapping(inverse=False):
         + list(one_way_replacements.keys())
     )
     replacements = {}
+    seen_m7vs = set()
     for m6v in all_possible_magicc6_vars:
         if m6v in special_case_replacements:
             replacements[m6v] = special_case_replacements[m6v]
+            seen_m7vs.add(replacements[m6v])
         elif (
             m6v in magicc6_sometimes_underscore_vars and not inverse
         ):  # underscores one way
@@ -605,42 +656,40 @@ def get_magicc6_to_magicc7_variable_mapping(inverse=False):
         elif (m6v in one_way_replacements) and not inverse:
             replacements[m6v] = one_way_replacements[m6v]
         else:
-            m7v = m6v.replace("-", "").replace(" ", "").upper()
+            m7v = m6v.translate(_MAGICC6_SEPARATORS_TRANSLATION).upper()
             # i.e. if we've already got a value for the inverse, we don't
             # want to overwrite it
-            if (m7v in replacements.values()) and inverse:
+            if inverse and m7v in seen_m7vs:
                 continue
             replacements[m6v] = m7v
+            seen_m7vs.add(m7v)
 
     if inverse:
-        return {v: k for k, v in replacements.items()}
+        return _freeze_mapping({v: k for k, v in replacements.items()})
     else:
-        return replacements
+        return _freeze_mapping(replacements)
 
 
-MAGICC6_TO_MAGICC7_VARIABLES_MAPPING = get_magicc6_to_magicc7_variable_mapping()
-"""dict: Mappings from MAGICC6 variables to MAGICC7 variables
+MAGICC6_TO_MAGICC7_VARIABLES_MAPPING = _get_magicc6_to_magicc7_variable_mapping(False)
+"""types.MappingProxyType: Read-only mappings from MAGICC6 variables to MAGICC7 variables
 """
 
-MAGICC7_TO_MAGICC6_VARIABLES_MAPPING = get_magicc6_to_magicc7_variable_mapping(
-    inverse=True
-)
-"""dict: Mappings from MAGICC7 variables to MAGICC6 variables
+MAGICC7_TO_MAGICC6_VARIABLES_MAPPING = _get_magicc6_to_magicc7_variable_mapping(True)
+"""types.MappingProxyType: Read-only mappings from MAGICC7 variables to MAGICC6 variables
 """
 
 
-@functools.lru_cache(None)
-def _apply_convert_magicc6_to_magicc7_variables(variables, inverse):
-    def hfc245ca_included(variables):
-        variables = [variables] if isinstance(variables, str) else variables
-        return any([v.replace("-", "").lower() == "hfc245ca" for v in variables])
-
-    if hfc245ca_included(variables):
+def _check_hfc245ca_included(variables):
+    variables = [variables] if isinstance(variables, str) else variables
+    if any([v.replace("-", "").lower() == "hfc245ca" for v in variables]):
         error_msg = (
             "HFC245ca wasn't meant to be included in MAGICC6. Renaming to HFC245fa."
         )
         warnings.warn(error_msg)
 
+
+@functools.lru_cache(maxsize=4096)
+def _apply_convert_magicc6_to_magicc7_variables(variables, inverse):
     if inverse:
         return apply_string_substitutions(
             variables,
@@ -684,6 +733,9 @@ def convert_magicc6_to_magicc7_variables(variables, inverse=False):
     ``type(variables)``
         Set of converted variables
     """
+    # check outside of the cached conversion so that we warn on every call
+    _check_hfc245ca_included(variables)
+
     if isinstance(variables, (list, pd.Index)):
         return [
             _apply_convert_magicc6_to_magicc7_variables(v, inverse) for v in variables
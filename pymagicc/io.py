@@ -1421,16 +1421,14 @@ class _CompactOutReader(_Reader):
 
             return {"variable": variable, "region": region, "year": year}
 
-        ts["variable"] = ts.index.map(
-            lambda x: convert_magicc7_to_openscm_variables(
-                x.split("__")[0].replace("DAT_", "")
-            )
-        )
-        ts["region"] = ts.index.map(
-            lambda x: convert_magicc_to_openscm_regions(x.split("__")[1])
+        # split the ids once and pass each column to the converters as a list
+        ts_ids = [inid.split("__") for inid in ts.index]
+        ts["variable"] = convert_magicc7_to_openscm_variables(
+            [parts[0].replace("DAT_", "") for parts in ts_ids]
         )
+        ts["region"] = convert_magicc_to_openscm_regions([parts[1] for parts in ts_ids])
 
-        ts["year"] = ts.index.map(lambda x: x.split("__")[2])
+        ts["year"] = [parts[2] for parts in ts_ids]
         # Make sure all the year strings are four characters long. Not the best test,
         # but as good as we can do for now.
         if not (ts["year"].apply(len) == 4).all():  # pragma: no cover # safety valve
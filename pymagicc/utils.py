@@ -8,9 +8,9 @@ thinks, "I need this, I can't find it anywhere else and I would probably use it
 in another project". One day we may move all these utility functions to another
 project to make it easier for ourselves and others to re-use them.
 """
-from copy import deepcopy
 import re
 import datetime
+import functools
 import warnings
 
 
@@ -28,14 +28,44 @@ def _compile_replacement_regexp(rep_dict, case_insensitive=False):
     )
 
 
-def _multiple_replace(in_str, rep_dict, compiled_regexp):
+@functools.lru_cache(maxsize=128)
+def _get_replacement_regexp(substitutions, case_insensitive):
+    # substitutions is a tuple of (old, new) pairs so that it can be hashed. Compiling
+    # the regexp and building the lookup are the expensive bits so we only want to do
+    # them once for each set of substitutions rather than every time they're applied.
+    rep_dict = dict(substitutions)
+    # only possible to have conflicting substitutions when case insensitive
+    if case_insensitive:
+        _check_duplicate_substitutions(rep_dict)
+
+    compiled_regexp = _compile_replacement_regexp(
+        rep_dict, case_insensitive=case_insensitive
+    )
     # To handle cases where compiled regexp is case insensitive, we can alter our
     # rep_dict keys to be all upper case cases and then replace by converting our
     # found groups to all upper case too. As long as our rep_dict values do not
     # change, the behaviour is as desired.
-    rep_dict = {k.upper(): v for k, v in rep_dict.items()}
-    out_str = compiled_regexp.sub(lambda x: rep_dict[x.group(0).upper()], in_str)
-    return out_str
+    if case_insensitive:
+        rep_dict = {k.upper(): v for k, v in rep_dict.items()}
+
+    return compiled_regexp, rep_dict
+
+
+def _multiple_replace(in_str, rep_dict, compiled_regexp):
+    case_insensitive = compiled_regexp.flags & re.IGNORECASE
+
+    # If the whole string is a key, the longest match at the start of the string is
+    # the whole string so the result is simply the key's value. This is by far the
+    # most common case so we skip the (relatively slow) regexp substitution.
+    try:
+        return rep_dict[in_str.upper() if case_insensitive else in_str]
+    except KeyError:
+        pass
+
+    if case_insensitive:
+        return compiled_regexp.sub(lambda x: rep_dict[x.group(0).upper()], in_str)
+
+    return compiled_regexp.sub(lambda x: rep_dict[x.group(0)], in_str)
 
 
 def _check_unused_substitutions(
@@ -165,28 +195,19 @@ def apply_string_substitutions(
     if inverse:
         substitutions = {v: k for k, v in substitutions.items()}
 
-    # only possible to have conflicting substitutions when case insensitive
-    if case_insensitive:
-        _check_duplicate_substitutions(substitutions)
-
     if unused_substitutions != "ignore":
         _check_unused_substitutions(
             substitutions, inputs, unused_substitutions, case_insensitive
         )
 
-    compiled_regexp = _compile_replacement_regexp(
-        substitutions, case_insensitive=case_insensitive
+    compiled_regexp, rep_dict = _get_replacement_regexp(
+        tuple(substitutions.items()), bool(case_insensitive)
     )
 
-    inputs_return = deepcopy(inputs)
-    if isinstance(inputs_return, str):
-        inputs_return = _multiple_replace(inputs_return, substitutions, compiled_regexp)
-    else:
-        inputs_return = [
-            _multiple_replace(v, substitutions, compiled_regexp) for v in inputs_return
-        ]
+    if isinstance(inputs, str):
+        return _multiple_replace(inputs, rep_dict, compiled_regexp)
 
-    return inputs_return
+    return [_multiple_replace(v, rep_dict, compiled_regexp) for v in inputs]
 
 
 def get_date_time_string():
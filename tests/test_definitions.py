@@ -41,6 +41,10 @@ def test_convert_magicc6_to_magicc7_variables_hfc245ca_warning(magicc6):
     with pytest.warns(UserWarning, match=warning_msg):
         convert_magicc6_to_magicc7_variables(magicc6)
 
+    # conversions are cached but we should still warn every time
+    with pytest.warns(UserWarning, match=warning_msg):
+        convert_magicc6_to_magicc7_variables(magicc6)
+
 
 @pytest.mark.parametrize(
     "magicc7, magicc6",
@@ -278,3 +282,18 @@ def test_convert_openscm_to_magicc_regions(magicc7, openscm):
 )
 def test_convert_openscm_to_magicc_regions_one_way(magicc7, openscm):
     assert convert_magicc_to_openscm_regions(magicc7, inverse=False) == openscm
+
+
+def test_mappings_read_only():
+    import pymagicc.definitions
+
+    with pytest.raises(TypeError):
+        pymagicc.definitions.MAGICC7_TO_OPENSCM_VARIABLES_MAPPING["CO2_EMIS"] = "junk"
+
+    # the getters return a copy which is safe to modify
+    mapping = pymagicc.definitions.get_magicc7_to_openscm_variable_mapping()
+    mapping["CO2_EMIS"] = "junk"
+    assert (
+        pymagicc.definitions.MAGICC7_TO_OPENSCM_VARIABLES_MAPPING["CO2_EMIS"]
+        == "Emissions|CO2"
+    )
@@ -10,25 +10,24 @@ import re
 
 
 from pymagicc.io import MAGICCData
-from pymagicc.utils import apply_string_substitutions
+from pymagicc.utils import apply_string_substitutions, _get_replacement_regexp
 from .conftest import MAGICC6_DIR, TEST_DATA_DIR, TEST_OUT_DIR
 
 
-@patch("pymagicc.utils._compile_replacement_regexp")
+@patch("pymagicc.utils._get_replacement_regexp")
 @patch("pymagicc.utils._multiple_replace")
 @patch("pymagicc.utils._check_unused_substitutions")
-@patch("pymagicc.utils._check_duplicate_substitutions")
 def test_apply_string_substitutions(
-    mock_check_duplicate_substitutions,
     mock_check_unused_substitutions,
     mock_multiple_replace,
-    mock_compile_replacement_regexp,
+    mock_get_replacement_regexp,
 ):
     treturn = "mocked return"
     mock_multiple_replace.return_value = treturn
 
     tcompiled_regexp = "mocked regexp"
-    mock_compile_replacement_regexp.return_value = tcompiled_regexp
+    trep_dict = "mocked rep dict"
+    mock_get_replacement_regexp.return_value = (tcompiled_regexp, trep_dict)
 
     tinput = "Hello JimBob"
     tsubstitutions = {"Jim": "Bob"}
@@ -44,14 +43,40 @@ def test_apply_string_substitutions(
 
     assert result == treturn
 
-    mock_check_duplicate_substitutions.assert_called_with(tsubstitutions)
     mock_check_unused_substitutions.assert_called_with(
         tsubstitutions, tinput, tunused_substitutions, tcase_insensitive
     )
+    mock_get_replacement_regexp.assert_called_with(
+        tuple(tsubstitutions.items()), bool(tcase_insensitive)
+    )
+    mock_multiple_replace.assert_called_with(tinput, trep_dict, tcompiled_regexp)
+
+
+@patch("pymagicc.utils._compile_replacement_regexp")
+@patch("pymagicc.utils._check_duplicate_substitutions")
+def test_get_replacement_regexp(
+    mock_check_duplicate_substitutions, mock_compile_replacement_regexp
+):
+    tcompiled_regexp = "mocked regexp"
+    mock_compile_replacement_regexp.return_value = tcompiled_regexp
+
+    tsubstitutions = {"Jim": "Bob"}
+
+    _get_replacement_regexp.cache_clear()
+    res = _get_replacement_regexp(tuple(tsubstitutions.items()), True)
+    assert res == (tcompiled_regexp, {"JIM": "Bob"})
+
+    mock_check_duplicate_substitutions.assert_called_with(tsubstitutions)
     mock_compile_replacement_regexp.assert_called_with(
-        tsubstitutions, case_insensitive=tcase_insensitive
+        tsubstitutions, case_insensitive=True
     )
-    mock_multiple_replace.assert_called_with(tinput, tsubstitutions, tcompiled_regexp)
+
+    # the result is cached so the checks and compilation only happen once
+    _get_replacement_regexp(tuple(tsubstitutions.items()), True)
+    assert mock_check_duplicate_substitutions.call_count == 1
+    assert mock_compile_replacement_regexp.call_count == 1
+
+    _get_replacement_regexp.cache_clear()
 
 
 # would be ideal to have these come from docstring rather
@@ -67,6 +92,12 @@ def test_apply_string_substitutions(
         ),
         ("Muttons Butter", {"M": "B", "Button": "Zip"}, "Buttons Butter"),
         ("Muttons Butter", {"Mutton": "Gutter", "tt": "zz"}, "Gutters Buzzer"),
+        ("Jim says, 'JIM'", {"Jim": "Bob", "JIM": "BOB"}, "Bob says, 'BOB'"),
+        # whole string is a key
+        ("JimBob", {"Jim": "Bob", "JimBob": "Zip"}, "Zip"),
+        ("JIM", {"Jim": "Bob", "JIM": "BOB"}, "BOB"),
+        # contains a key but isn't one so still goes through the regexp
+        (["Jim", "Jim's"], {"Jim": "Bob"}, ["Bob", "Bob's"]),
     ],
 )
 def test_apply_string_substitutions_default(inputs, substitutions, expected):
@@ -91,7 +122,15 @@ def test_apply_string_substitutions_inverse(inputs, substitutions, expected):
 
 
 @pytest.mark.parametrize(
-    "inputs, substitutions, expected", [("Butter", {"buTTer": "Gutter"}, "Gutter")]
+    "inputs, substitutions, expected",
+    [
+        ("Butter", {"buTTer": "Gutter"}, "Gutter"),
+        # whole string is a key which only differs in case
+        ("butter", {"But": "Cut", "BUTTER": "Gutter"}, "Gutter"),
+        # contains a key but isn't one so still goes through the regexp
+        ("Butter knife", {"buTTer": "Gutter"}, "Gutter knife"),
+        (["BUTTER", "butters"], {"Butter": "Gutter"}, ["Gutter", "Gutters"]),
+    ],
 )
 def test_apply_string_substitutions_case_insensitive(inputs, substitutions, expected):
     result = apply_string_substitutions(inputs, substitutions, case_insensitive=True)